@@ -1,4 +1,5 @@
 """Streamlit web UI for Ollama Debate (web interface layer)."""
+import asyncio
 from pathlib import Path
 
 import streamlit as st
@@ -7,10 +8,11 @@ from arena import (
     Arena,
     BattleResult,
     Participant,
-    check_ollama_running,
+    OllamaNotRunningError,
     ensure_models_available,
     load_config,
     save_debate_to_md,
+    warm_up_models,
 )
 
 
@@ -32,21 +34,22 @@ def load_config_safe():
         return None
 
 
-def ensure_ollama() -> bool:
-    """Return True if Ollama is reachable; show st.error and return False otherwise."""
+def ensure_models(model_m: str, model_s: str, model_judge: str, endpoints: dict, max_parallel_pulls: int) -> bool:
+    """Ensure Ollama is reachable and models exist; pull if missing. Return True on success."""
     try:
-        check_ollama_running()
+        asyncio.run(
+            ensure_models_available(
+                model_m,
+                model_s,
+                model_judge,
+                endpoints=endpoints,
+                max_parallel_pulls=max_parallel_pulls,
+            )
+        )
         return True
-    except Exception as e:
-        st.error(f"Ollama server is not running: {e}. Start Ollama or run `ollama serve`.")
+    except OllamaNotRunningError as e:
+        st.error(f"{e}. Start Ollama or run `ollama serve`.")
         return False
-
-
-def ensure_models(model_m: str, model_s: str, model_judge: str) -> bool:
-    """Ensure models exist; pull if missing. Return True on success."""
-    try:
-        ensure_models_available(model_m, model_s, model_judge)
-        return True
     except Exception as e:
         st.error(f"Model error: {e}")
         return False
@@ -81,6 +84,7 @@ def main():
 
     models_cfg = config.get("models") or {}
     settings_cfg = config.get("settings") or {}
+    endpoints = config.get("ollama_endpoints") or {}
 
     with st.sidebar:
         st.header("Settings")
@@ -105,18 +109,12 @@ def main():
         st.warning("Please enter a debate topic.")
         st.stop()
 
-    if not ensure_ollama():
-        st.stop()
-
     with st.spinner("Checking / pulling models..."):
-        if not ensure_models(model_m, model_s, model_judge):
+        if not ensure_models(
+            model_m, model_s, model_judge, endpoints, int(settings_cfg.get("max_parallel_pulls", 2))
+        ):
             st.stop()
 
-    st.markdown("---")
-    st.markdown(f"**Topic:** {topic}")
-    st.markdown(f"*Rounds: {rounds} · Machiavelli: {model_m} · Socrates: {model_s} · Judge: {model_judge}*")
-    st.divider()
-
     llm_options = {
         "num_predict": settings_cfg.get("num_predict", 350),
         "temperature": settings_cfg.get("temperature", 0.8),
@@ -132,6 +130,7 @@ def main():
             "You are Machiavelli. Speak English. You are a cynical pragmatist. Defend state interest and order at any cost.",
         ),
         icon="🦊",
+        host=endpoints.get("machiavelli"),
     )
     socrates = Participant(
         name="Socrates",
@@ -141,6 +140,7 @@ def main():
             "You are Socrates. Speak English. Use Socratic method: ask short, probing questions. Be humble but ironic.",
         ),
         icon="🏛",
+        host=endpoints.get("socrates"),
     )
     judge = Participant(
         name="Judge",
@@ -150,9 +150,49 @@ def main():
             "You are the Supreme Judge. Analyze the debate. Who won: Socrates or Machiavelli? Answer briefly and strictly in English.",
         ),
         icon="⚖️",
+        host=endpoints.get("judge"),
+    )
+
+    arena = Arena(
+        machiavelli=machiavelli,
+        socrates=socrates,
+        judge=judge,
+        llm_options=llm_options,
+        history_window=int(settings_cfg.get("history_window", 2)),
+        keep_alive=settings_cfg.get("keep_alive", "30m"),
+        opening_num_predict=int(settings_cfg.get("opening_num_predict", 120)),
+        judge_num_predict=int(settings_cfg.get("judge_num_predict", 200)),
+        warm_up_judge=not settings_cfg.get("warm_up", True),
     )
 
-    arena = Arena(machiavelli=machiavelli, socrates=socrates, judge=judge, llm_options=llm_options)
+    if settings_cfg.get("warm_up", True):
+        model_names = list(dict.fromkeys((model_m, model_s, model_judge)))
+        with st.spinner("Loading models..."):
+            try:
+                evicted = asyncio.run(
+                    warm_up_models(
+                        model_m,
+                        model_s,
+                        model_judge,
+                        keep_alive=settings_cfg.get("keep_alive", "30m"),
+                        endpoints=endpoints,
+                        options=arena.load_options(topic.strip(), int(rounds)),
+                    )
+                )
+            except Exception as e:
+                st.error(f"Model error: {e}")
+                st.stop()
+        if evicted:
+            st.warning(
+                f"Not all models stay loaded at once ({', '.join(evicted)} evicted); weights will be reloaded "
+                f"between turns. Start Ollama with `OLLAMA_MAX_LOADED_MODELS={len(model_names)}` if memory allows."
+            )
+
+    st.markdown("---")
+    st.markdown(f"**Topic:** {topic}")
+    st.markdown(f"*Rounds: {rounds} · Machiavelli: {model_m} · Socrates: {model_s} · Judge: {model_judge}*")
+    st.divider()
+
     collected_result: dict = {}
 
     def on_speech(entry: dict) -> None:
@@ -163,11 +203,13 @@ def main():
         st.markdown(f"**{text}**")
         st.caption(f"Tokens: prompt {p}, completion {c}, total {p + c}")
 
-    result: BattleResult = arena.run_battle(
-        topic.strip(),
-        rounds=int(rounds),
-        on_speech=on_speech,
-        on_verdict=on_verdict,
+    result: BattleResult = asyncio.run(
+        arena.run_battle(
+            topic.strip(),
+            rounds=int(rounds),
+            on_speech=on_speech,
+            on_verdict=on_verdict,
+        )
     )
 
     if result.interrupted:
@@ -188,6 +230,8 @@ def main():
                 "total": result.token_total,
             },
             debates_dir=debates_dir,
+            include_thoughts=bool(settings_cfg.get("save_thoughts", False)),
+            compress=bool(settings_cfg.get("compress", False)),
         )
         st.success(f"Debate saved to **{filepath}**")
     except OSError as e:
@@ -8,35 +8,76 @@ This module contains:
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import json
+import os
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import date
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import ollama
 import yaml
 import re
 
+if TYPE_CHECKING:
+    import ollama
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 CONFIG_PATH = Path(__file__).resolve().parent / "config.yaml"
+MODEL_CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ollama-debate" / "models.json"
+MODEL_CACHE_TTL = 24 * 60 * 60  # seconds a verified model is trusted without asking the server
+
+_RE_MULTI_NL = re.compile(r"\n+")
+_RE_SLUG_DROP = re.compile(r"[^\w\s-]")
+_RE_SLUG_SEP = re.compile(r"[-\s]+")
+# Same deletions as _RE_SLUG_DROP, restricted to ASCII, for the str.translate fast path.
+_SLUG_ASCII_DROP = str.maketrans("", "", "".join(c for c in map(chr, range(128)) if _RE_SLUG_DROP.match(c)))
 
 
 def clean_text(text: str) -> str:
     """Remove excessive line breaks and surrounding whitespace."""
-    text = re.sub(r"\n+", "\n", text).strip()
-    return text
+    # Most replies have no blank lines; only run the regex when there is a run to collapse.
+    if "\n\n" in text:
+        text = _RE_MULTI_NL.sub("\n", text)
+    return text.strip()
 
 
 def extract_think(text: str) -> Tuple[str, str]:
-    """Separate <think>...</think> block from the visible content."""
-    think_match = re.search(r"<think>(.*?)</think>", text, re.DOTALL)
-    content = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
-
-    think_text = think_match.group(1).strip() if think_match else ""
+    """Separate <think>...</think> blocks from the visible content.
+
+    Uses str.partition instead of a regex. The first block becomes the think
+    text; every complete block is removed from the content.
+    """
+    before, open_tag, rest = text.partition("<think>")
+    think_text, close_tag, after = rest.partition("</think>")
+    if not (open_tag and close_tag):
+        return "", clean_text(text)
+
+    parts = [before]
+    while "<think>" in after:
+        head, _, rest = after.partition("<think>")
+        _, close_tag, tail = rest.partition("</think>")
+        if not close_tag:
+            break  # an unclosed tag is kept as text
+        parts.append(head)
+        after = tail
+    parts.append(after)
+
+    # Collapse newlines before capping, so each part is cleaned in one pass.
+    think_text = clean_text(think_text)
     if len(think_text) > 200:
         think_text = think_text[:200] + "..."
 
-    return clean_text(think_text), clean_text(content)
+    return think_text, clean_text("".join(parts))
 
 
 def token_counts(response: Dict[str, Any]) -> Tuple[int, int]:
@@ -46,15 +87,20 @@ def token_counts(response: Dict[str, Any]) -> Tuple[int, int]:
     return int(prompt), int(completion)
 
 
+def transcript_text(transcript_entries: List[Dict[str, Any]]) -> str:
+    """Render transcript entries as 'Name: speech' lines for the judge prompt."""
+    return "\n".join(f"{e['name']}: {e['speech']}" for e in transcript_entries)
+
+
 def topic_to_slug(topic: str) -> str:
     """Convert a topic to a filename-safe slug (max 240 chars)."""
     slug = topic.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[-\s]+", "_", slug)
+    slug = slug.translate(_SLUG_ASCII_DROP) if slug.isascii() else _RE_SLUG_DROP.sub("", slug)
+    slug = _RE_SLUG_SEP.sub("_", slug)
     return slug[:240] if slug else "debate"
 
 
-def build_markdown(
+def _iter_markdown(
     topic: str,
     model_m: str,
     model_s: str,
@@ -62,50 +108,66 @@ def build_markdown(
     transcript_entries: List[Dict[str, Any]],
     verdict: str,
     token_stats: Optional[Dict[str, int]] = None,
-) -> str:
-    """Build full Markdown content for the debate file."""
-    lines: List[str] = [
-        f"# Debate: {topic}",
-        "",
-        "## Participants",
-        "",
-        f"- **Socrates:** `{model_s}`",
-        f"- **Machiavelli:** `{model_m}`",
-        f"- **Judge:** `{model_judge}`",
-        "",
-        "## Transcript",
-        "",
-    ]
+    include_thoughts: bool = False,
+) -> Iterator[str]:
+    """Yield the debate Markdown line by line, each line ending with a newline."""
+    yield f"# Debate: {topic}\n"
+    yield "\n"
+    yield "## Participants\n"
+    yield "\n"
+    yield f"- **Socrates:** `{model_s}`\n"
+    yield f"- **Machiavelli:** `{model_m}`\n"
+    yield f"- **Judge:** `{model_judge}`\n"
+    yield "\n"
+    yield "## Transcript\n"
+    yield "\n"
     for entry in transcript_entries:
         name = entry["name"]
         icon = entry["icon"]
-        think = (entry.get("think") or "").strip()
+        think = (entry.get("think") or "").strip() if include_thoughts else ""
         speech = entry["speech"]
         if think:
-            lines.append("<details><summary>Thoughts</summary>")
-            lines.append("")
-            lines.append(think)
-            lines.append("")
-            lines.append("</details>")
-            lines.append("")
-        lines.append(f"> **{icon} {name}:**")
-        for line in speech.split("\n"):
-            lines.append(f"> {line}")
-        lines.append("")
-    lines.extend(["## Verdict", "", (verdict or "").strip(), ""])
+            yield "<details><summary>Thoughts</summary>\n"
+            yield "\n"
+            yield think + "\n"
+            yield "\n"
+            yield "</details>\n"
+            yield "\n"
+        yield f"> **{icon} {name}:**\n"
+        yield "> " + speech.replace("\n", "\n> ") + "\n"
+        yield "\n"
+    yield "## Verdict\n"
+    yield "\n"
+    yield (verdict or "").strip() + "\n"
     if token_stats:
-        lines.extend(
-            [
-                "",
-                "## Token usage",
-                "",
-                f"- **Prompt tokens:** {token_stats['prompt']}",
-                f"- **Completion tokens:** {token_stats['completion']}",
-                f"- **Total:** {token_stats['total']}",
-                "",
-            ]
+        yield "\n"
+        yield "\n"
+        yield "## Token usage\n"
+        yield "\n"
+        yield f"- **Prompt tokens:** {token_stats['prompt']}\n"
+        yield f"- **Completion tokens:** {token_stats['completion']}\n"
+        yield f"- **Total:** {token_stats['total']}\n"
+
+
+def build_markdown(
+    topic: str,
+    model_m: str,
+    model_s: str,
+    model_judge: str,
+    transcript_entries: List[Dict[str, Any]],
+    verdict: str,
+    token_stats: Optional[Dict[str, int]] = None,
+    include_thoughts: bool = False,
+) -> str:
+    """Build full Markdown content for the debate file.
+
+    <think> summaries are omitted unless include_thoughts is True.
+    """
+    return "".join(
+        _iter_markdown(
+            topic, model_m, model_s, model_judge, transcript_entries, verdict, token_stats, include_thoughts
         )
-    return "\n".join(lines)
+    )
 
 
 def save_debate_to_md(
@@ -117,66 +179,271 @@ def save_debate_to_md(
     verdict: str,
     token_stats: Optional[Dict[str, int]] = None,
     debates_dir: str = "debates",
+    include_thoughts: bool = False,
+    compress: bool = False,
 ) -> str:
-    """Save debate to debates_dir/YYYY-MM-DD_slug.md, creating directory if needed."""
+    """Save debate to debates_dir/YYYY-MM-DD_slug.md, creating directory if needed.
+
+    With compress=True the file is gzip-compressed and gets a .md.gz suffix.
+    """
     out_dir = Path(debates_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     today = date.today().isoformat()
     slug = topic_to_slug(topic)
-    filename = f"{today}_{slug}.md"
+    filename = f"{today}_{slug}.md.gz" if compress else f"{today}_{slug}.md"
     filepath = out_dir / filename
-    md = build_markdown(topic, model_m, model_s, model_judge, transcript_entries, verdict or "", token_stats)
-    filepath.write_text(md, encoding="utf-8")
+    chunks = _iter_markdown(
+        topic, model_m, model_s, model_judge, transcript_entries, verdict or "", token_stats, include_thoughts
+    )
+    # Stream lines through one buffered writer instead of materializing the whole document.
+    # compresslevel=3 keeps most of the size win at a fraction of the CPU of level 9.
+    out = gzip.open(filepath, "wb", compresslevel=3) if compress else filepath.open("wb", buffering=1 << 16)
+    with out as f:
+        f.writelines(chunk.encode("utf-8") for chunk in chunks)
     return str(filepath)
 
 
+@lru_cache(maxsize=1)
+def _parse_config(cfg_path: Path, mtime_ns: int) -> Any:
+    """Parse a config file; cached per (path, mtime) so an edited file is re-read."""
+    with cfg_path.open(encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def load_config(path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load config.yaml and return its dict; raise on error."""
+    """Load config.yaml and return its dict; raise on error.
+
+    Uses the LibYAML loader when available. The returned dict is shared
+    between calls, so callers must not mutate it.
+    """
     cfg_path = path or CONFIG_PATH
     if not cfg_path.is_file():
         raise FileNotFoundError(f"Config file not found: {cfg_path}")
-    with cfg_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _parse_config(cfg_path, cfg_path.stat().st_mtime_ns)
     if not data:
         raise ValueError("config.yaml is empty.")
     return data
 
 
-def check_ollama_running() -> None:
-    """Raise RuntimeError if Ollama server is not reachable."""
+class OllamaNotRunningError(RuntimeError):
+    """Raised when the Ollama server cannot be reached."""
+
+
+# ollama (and httpx under it) makes up most of this module's import time, so it is
+# imported on first use; config, slug and Markdown helpers and --help never need it.
+@lru_cache(maxsize=1)
+def _ollama() -> Any:
+    import ollama
+
+    return ollama
+
+
+# Client class used for every request; None means ollama.AsyncClient. Tests set it to a fake.
+AsyncClient: Optional[type] = None
+
+
+async def _model_exists(client: ollama.AsyncClient, model_name: str) -> bool:
+    """Return False if the server answers 404 for model_name; re-raise other errors."""
     try:
-        ollama.list()
-    except Exception as e:  # pragma: no cover - depends on external service
-        raise RuntimeError(f"Ollama server is not running: {e}") from e
+        await client.show(model_name)
+    except _ollama().ResponseError as e:
+        if e.status_code == 404:
+            return False
+        raise
+    return True
 
 
-def _model_in_list(model_name: str, listed_names: List[str]) -> bool:
-    if model_name in listed_names:
-        return True
-    base = model_name.split(":")[0] if ":" in model_name else model_name
-    return any(n == model_name or n.startswith(base + ":") for n in listed_names)
+def _model_targets(
+    model_m: str, model_s: str, model_judge: str, endpoints: Optional[Dict[str, Optional[str]]]
+) -> List[Tuple[str, Optional[str]]]:
+    """Return distinct (model, host) pairs; endpoints maps role name to server URL."""
+    endpoints = endpoints or {}
+    pairs = (
+        (model_m, endpoints.get("machiavelli")),
+        (model_s, endpoints.get("socrates")),
+        (model_judge, endpoints.get("judge")),
+    )
+    return list(dict.fromkeys(pairs))
 
 
-def ensure_models_available(model_m: str, model_s: str, model_judge: str) -> None:
-    """Ensure all three models are present locally; pull any missing ones."""
+def _clients(hosts: Iterable[Optional[str]]) -> Dict[Optional[str], ollama.AsyncClient]:
+    """One AsyncClient per distinct host (None means OLLAMA_HOST or the default)."""
+    client_class = AsyncClient or _ollama().AsyncClient
+    return {host: client_class(host=host) for host in dict.fromkeys(hosts)}
+
+
+def _endpoint_key(host: Optional[str]) -> str:
+    return host or os.environ.get("OLLAMA_HOST") or "default"
+
+
+def _load_model_cache() -> Dict[str, Dict[str, float]]:
+    """Return {endpoint: {model: last_verified_ts}}; empty if the cache is missing or corrupt."""
+    try:
+        with MODEL_CACHE_PATH.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_model_cache(cache: Dict[str, Dict[str, float]]) -> None:
+    try:
+        MODEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        MODEL_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass  # the cache only saves round-trips; never fail a debate over it
+
+
+def _forget_missing_model(error: BaseException, model_name: str, host: Optional[str]) -> None:
+    """Drop model_name from the cache if error is the server's 404 for it."""
+    if isinstance(error, _ollama().ResponseError) and error.status_code == 404:
+        cache = _load_model_cache()
+        if (cache.get(_endpoint_key(host)) or {}).pop(model_name, None) is not None:
+            _save_model_cache(cache)
+
+
+async def _pull_model(
+    client: ollama.AsyncClient,
+    model_name: str,
+    limit: asyncio.Semaphore,
+    on_progress: Optional[Any],
+) -> None:
+    """Pull one model, reporting each progress update to on_progress."""
+    async with limit:
+        try:
+            async for update in await client.pull(model_name, stream=True):
+                if on_progress is not None:
+                    on_progress(
+                        model_name,
+                        update.get("status") or "",
+                        update.get("completed") or 0,
+                        update.get("total") or 0,
+                    )
+        except Exception as e:
+            raise RuntimeError(f"Failed to pull model {model_name}: {e}") from e
+
+
+async def ensure_models_available(
+    model_m: str,
+    model_s: str,
+    model_judge: str,
+    endpoints: Optional[Dict[str, Optional[str]]] = None,
+    on_progress: Optional[Any] = None,
+    max_parallel_pulls: int = 2,
+) -> None:
+    """Ensure all three models are present on their servers; pull any missing ones.
+
+    The existence probes are independent, so they are issued concurrently.
+    They double as the server connectivity check: OllamaNotRunningError is
+    raised if a server cannot be reached. Models verified on the same endpoint
+    within MODEL_CACHE_TTL are not probed one by one; they are looked up in a
+    single list() call per server instead.
+
+    Missing models are pulled concurrently, at most max_parallel_pulls at a
+    time so a single link is not oversubscribed. If on_progress is provided,
+    it is called with (model_name, status, completed_bytes, total_bytes).
+    """
+    cache = _load_model_cache()
+    now = time.time()
+
+    def is_fresh(model_name: str, host: Optional[str]) -> bool:
+        seen = (cache.get(_endpoint_key(host)) or {}).get(model_name)
+        return isinstance(seen, (int, float)) and now - seen < MODEL_CACHE_TTL
+
+    all_targets = _model_targets(model_m, model_s, model_judge, endpoints)
+    targets = [t for t in all_targets if not is_fresh(*t)]
+    cached = [t for t in all_targets if is_fresh(*t)]
+    clients = _clients(host for _, host in all_targets)
+    # Cached models are checked against a single list() call per server instead
+    # of one show() each: a stopped server is still reported here, and a model
+    # removed since it was cached falls through to the pull below.
+    listed_hosts = list(dict.fromkeys(host for _, host in cached))
     try:
-        data = ollama.list()
+        present, listings = await asyncio.gather(
+            asyncio.gather(*(_model_exists(clients[host], m) for m, host in targets)),
+            asyncio.gather(*(clients[host].list() for host in listed_hosts)),
+        )
+    except ConnectionError as e:
+        raise OllamaNotRunningError(f"Ollama server is not running: {e}") from e
     except Exception as e:  # pragma: no cover - depends on external service
         raise RuntimeError(f"Ollama error: {e}") from e
-    models = data.get("models") if isinstance(data, dict) else data
-    if not isinstance(models, list):
-        models = []
-    listed_names: List[str] = []
-    for m in models:
-        name = (m.get("name") or m.get("model") or "")
-        if name:
-            listed_names.append(name)
-    for model_name in (model_m, model_s, model_judge):
-        if not _model_in_list(model_name, listed_names):
-            try:  # pragma: no cover - depends on network / local registry
-                ollama.pull(model_name)
-            except Exception as e:
-                raise RuntimeError(f"Failed to pull model {model_name}: {e}") from e
+    installed = {
+        (host, _with_tag(m.get("model") or m.get("name") or ""))
+        for host, response in zip(listed_hosts, listings)
+        for m in (response.get("models") or [])
+    }
+    targets += cached
+    present = [*present, *((host, _with_tag(m)) in installed for m, host in cached)]
+    limit = asyncio.Semaphore(max(1, max_parallel_pulls))
+    await asyncio.gather(
+        *(
+            _pull_model(clients[host], model_name, limit, on_progress)
+            for (model_name, host), found in zip(targets, present)
+            if not found
+        )
+    )
+    for model_name, host in targets:
+        cache.setdefault(_endpoint_key(host), {})[model_name] = now
+    _save_model_cache(cache)
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+def _with_tag(model_name: str) -> str:
+    """Return model_name with an explicit tag, as reported by the server (e.g. ':latest')."""
+    return model_name if ":" in model_name else f"{model_name}:latest"
+
+
+async def warm_up_models(
+    model_m: str,
+    model_s: str,
+    model_judge: str,
+    keep_alive: Union[float, str] = "30m",
+    endpoints: Optional[Dict[str, Optional[str]]] = None,
+    options: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[str]:
+    """Load every distinct model concurrently and return those that did not stay resident.
+
+    Each model gets a one-token generate request with keep_alive, so weights are
+    in memory before the first round. A model that is missing from ps() afterwards
+    was evicted to make room for another one, which means the server will reload
+    weights between turns (raise OLLAMA_MAX_LOADED_MODELS or use smaller models).
+
+    options maps role name to the options the debate will send for it (see
+    Arena.load_options); loading with a different num_ctx would make the server
+    reload the model on its first real request. A model shared by several roles
+    is loaded with the options of the first one.
+    """
+    endpoints = endpoints or {}
+    options = options or {}
+    load_options: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+    for role, model_name in (("machiavelli", model_m), ("socrates", model_s), ("judge", model_judge)):
+        load_options.setdefault((model_name, endpoints.get(role)), options.get(role) or {})
+    targets = list(load_options)
+    clients = _clients(host for _, host in targets)
+
+    async def load(model_name: str, host: Optional[str]) -> None:
+        try:
+            await clients[host].generate(
+                model=model_name,
+                prompt="hi",
+                options={**load_options[model_name, host], "num_predict": 1},
+                keep_alive=keep_alive,
+            )
+        except Exception as e:
+            _forget_missing_model(e, model_name, host)
+            raise
+
+    await asyncio.gather(*(load(m, host) for m, host in targets))
+    running = await asyncio.gather(*(client.ps() for client in clients.values()))
+    loaded = {
+        (host, _with_tag(m.get("model") or m.get("name") or ""))
+        for host, response in zip(clients, running)
+        for m in (response.get("models") or [])
+    }
+    return [m for m, host in targets if (host, _with_tag(m)) not in loaded]
 
 
 @dataclass
@@ -187,6 +454,12 @@ class Participant:
     model: str
     system_prompt: str
     icon: str = ""
+    host: Optional[str] = None  # Ollama server URL; None uses OLLAMA_HOST / the default
+
+    @cached_property
+    def system_message(self) -> Dict[str, str]:
+        """The system chat message, built once and shared by every request."""
+        return {"role": "system", "content": self.system_prompt}
 
 
 @dataclass
@@ -217,49 +490,293 @@ class Arena:
         socrates: Participant,
         judge: Participant,
         llm_options: Optional[Dict[str, Any]] = None,
+        history_window: int = 2,
+        keep_alive: Optional[Union[float, str]] = None,
+        opening_num_predict: int = 120,
+        judge_num_predict: int = 200,
+        warm_up_judge: bool = True,
     ) -> None:
         self.machiavelli = machiavelli
         self.socrates = socrates
         self.judge = judge
         self.llm_options = llm_options or {"num_predict": 350, "temperature": 0.8, "num_ctx": 2048}
+        # Number of past exchanges each debater sees; 0 keeps the full history.
+        # Without a window every prompt re-sends the whole debate, so prefill cost
+        # grows with each round; the judge still receives the full transcript.
+        self.history_window = history_window
+        # How long the server keeps a debater model (and its cached prompt
+        # prefix) loaded after a turn; None uses the server default (5m).
+        self.keep_alive = keep_alive
+        # The opening statement is asked to be brief, so it gets a smaller budget.
+        self.opening_num_predict = opening_num_predict
+        self.judge_num_predict = judge_num_predict
+        # Load the judge during round 1; turn off when warm_up_models already did.
+        self.warm_up_judge = warm_up_judge
+
+    def _debater_options(self, topic: str) -> Dict[str, Any]:
+        """Return llm_options with num_ctx shrunk to what this debate can actually use.
+
+        With a history window the longest prompt is bounded: system prompt, the
+        opening, 2*window+1 messages of at most num_predict tokens each, plus room
+        to generate. num_ctx is sized once per debate (never above the configured
+        value) because changing it between requests makes Ollama reload the model.
+        """
+        num_predict = self.llm_options.get("num_predict")
+        num_ctx = self.llm_options.get("num_ctx")
+        if not self.history_window or not num_predict or num_predict < 0 or not num_ctx:
+            return self.llm_options
+        system_chars = max(len(self.machiavelli.system_prompt), len(self.socrates.system_prompt))
+        # ~4 characters per token, plus per-message template overhead
+        bound = (system_chars + len(topic)) // 4 + (2 * self.history_window + 2) * (num_predict + 16) + 128
+        sized = _next_pow2(bound)
+        if sized >= num_ctx:
+            return self.llm_options
+        return {**self.llm_options, "num_ctx": sized}
+
+    def _judge_options(self, transcript_chars: int) -> Dict[str, Any]:
+        """Options for the verdict: num_ctx sized to the transcript, capped verdict length.
+
+        Estimates ~3 characters per token so the transcript is never truncated.
+        """
+        tokens = (len(self.judge.system_prompt) + transcript_chars) // 3 + 64 + self.judge_num_predict
+        return {"num_ctx": max(1024, _next_pow2(tokens)), "num_predict": self.judge_num_predict}
+
+    def _upfront_judge_options(self, debater_options: Dict[str, Any], rounds: int) -> Optional[Dict[str, Any]]:
+        """Verdict options sized for the whole debate, or None if replies are uncapped.
 
-    def run_battle(
+        Knowing them before round 1 lets the judge be loaded once, with the
+        options every later judge request uses.
+        """
+        reply_cap = debater_options.get("num_predict") or 0
+        if reply_cap <= 0:
+            return None
+        speaker_chars = max(len(self.machiavelli.name), len(self.socrates.name)) + 3
+        return self._judge_options(2 * rounds * (4 * reply_cap + speaker_chars))
+
+    def load_options(self, topic: str, rounds: int) -> Dict[str, Dict[str, Any]]:
+        """Options each role's model is loaded with by run_battle(topic, rounds).
+
+        Pass them to warm_up_models so warm-up loads each model the way the
+        debate uses it. The judge is left out when its num_ctx is only known
+        once the debate is over (uncapped replies).
+        """
+        debater_options = self._debater_options(topic)
+        result = {"machiavelli": debater_options, "socrates": debater_options}
+        judge_options = self._upfront_judge_options(debater_options, rounds)
+        if judge_options is not None:
+            result["judge"] = judge_options
+        return result
+
+    def _start_reply(
+        self,
+        clients: Dict[Optional[str], ollama.AsyncClient],
+        participant: Participant,
+        messages: List[Dict[str, str]],
+        options: Optional[Dict[str, Any]],
+        keep_alive: Optional[Union[float, str]] = None,
+    ) -> asyncio.Task:
+        """Dispatch a streamed chat request without consuming it.
+
+        The returned task resolves to (stream, first_chunk) once the server has
+        produced its first chunk, so prefill runs while the caller does other work.
+        """
+
+        async def first_chunk() -> Tuple[Any, Any]:
+            stream = await clients[participant.host].chat(
+                model=participant.model,
+                messages=messages,
+                options=options,
+                stream=True,
+                keep_alive=keep_alive,
+            )
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+            except Exception as e:
+                # The request is only sent on the first chunk; a 404 means the
+                # model was removed, so the next run must not trust the cache.
+                _forget_missing_model(e, participant.model, participant.host)
+                raise
+
+        return asyncio.create_task(first_chunk())
+
+    async def _finish_reply(
+        self,
+        pending: asyncio.Task,
+        participant: Participant,
+        on_token: Optional[Any],
+    ) -> Tuple[str, Any]:
+        """Drain a reply started by _start_reply; return (full_text, final_chunk).
+
+        Each non-empty content chunk is forwarded to on_token(name, text). The
+        final chunk carries the token counts.
+        """
+        stream, chunk = await pending
+        parts: List[str] = []
+        last: Any = {}
+        while chunk is not None:
+            piece = chunk["message"]["content"]
+            if piece:
+                parts.append(piece)
+                if on_token is not None:
+                    on_token(participant.name, piece)
+            last = chunk
+            try:
+                chunk = await stream.__anext__()
+            except StopAsyncIteration:
+                chunk = None
+        return "".join(parts), last
+
+    @staticmethod
+    async def _deliver(on_speech: Optional[Any], entry: Dict[str, Any]) -> None:
+        """Call on_speech after yielding once, so a request dispatched just before goes out first."""
+        if on_speech is not None:
+            await asyncio.sleep(0)
+            on_speech(entry)
+
+    def _judge_messages(self, transcript_text: str) -> List[Dict[str, str]]:
+        return [
+            self.judge.system_message,
+            {"role": "user", "content": transcript_text},
+        ]
+
+    async def _prefill(
+        self,
+        clients: Dict[Optional[str], ollama.AsyncClient],
+        participant: Participant,
+        messages: List[Dict[str, str]],
+        options: Dict[str, Any],
+        keep_alive: Optional[Union[float, str]] = None,
+    ) -> None:
+        """Warm a participant's prompt cache with the prefix of its next prompt.
+
+        The real request starts with the same tokens, so the server can reuse
+        this prefix instead of evaluating it once the previous speech ends.
+        options are sent as given: the real request's options with num_predict
+        set to 1 (anything else that differs makes the server reload the model).
+        """
+        await clients[participant.host].chat(
+            model=participant.model,
+            messages=messages,
+            options=options,
+            keep_alive=keep_alive,
+        )
+
+    async def run_battle(
         self,
         topic: str,
         rounds: int = 3,
         on_speech: Optional[Any] = None,
         on_verdict: Optional[Any] = None,
+        on_token: Optional[Any] = None,
     ) -> BattleResult:
         """Run the full debate loop and return a BattleResult.
 
+        Turns are inherently sequential (each speaker answers the previous
+        speech), but each request is dispatched as soon as its input is known,
+        before the previous speech is handed to on_speech, so rendering overlaps
+        the next prefill. While Socrates speaks, the prefix of the next
+        Machiavelli prompt (or, in the last round, of the verdict prompt) is
+        prefilled concurrently; with OLLAMA_NUM_PARALLEL >= 2 or separate
+        servers this overlaps with the Socrates decode. Unless warm_up_judge is
+        off, a judge with its own model is loaded during round 1, after the
+        opening request. Every request passes keep_alive.
+
         If on_speech is provided, it is called after each participant reply with
         the transcript entry dict. If on_verdict is provided, it is called once
         with (verdict_text, prompt_tokens, completion_tokens) for the judge.
+        Replies are streamed; if on_token is provided, it is called with
+        (participant_name, text_chunk) for every chunk as it is generated.
         """
-        history_m: List[Dict[str, str]] = []
-        history_s: List[Dict[str, str]] = []
-        transcript_plain: List[str] = []
+        # System messages are shared so every prompt starts with the same
+        # prefix, which keeps the server's prompt cache warm. The bounded deques
+        # drop the oldest message in O(1); the extra slot is for the pending
+        # user turn, so each prompt holds history_window full exchanges.
+        system_m = self.machiavelli.system_message
+        system_s = self.socrates.system_message
+        maxlen = 2 * self.history_window + 1 if self.history_window else None
+        history_m: Deque[Dict[str, str]] = deque(maxlen=maxlen)
+        history_s: Deque[Dict[str, str]] = deque(maxlen=maxlen)
         transcript_entries: List[Dict[str, Any]] = []
         total_prompt = 0
         total_completion = 0
 
-        current_input = f"Start a debate on the topic: {topic}. State your position briefly."
+        options = self._debater_options(topic)
+        num_predict = options.get("num_predict")
+        if num_predict is None or num_predict < 0 or num_predict > self.opening_num_predict:
+            num_predict = self.opening_num_predict
+        # Every options dict is built once per debate and shared by all requests.
+        opening_options = {**options, "num_predict": num_predict}
+        prefill_options = {**options, "num_predict": 1}
+        pending: Optional[asyncio.Task] = None
+        prefill: Optional[asyncio.Task] = None
+        judge_warm: Optional[asyncio.Task] = None
+        judge_options: Optional[Dict[str, Any]] = None
+        judge_prefill_options: Optional[Dict[str, Any]] = None
+
+        # Each participant may live on its own server (e.g. one instance per GPU).
+        clients = _clients(p.host for p in (self.machiavelli, self.socrates, self.judge))
+
+        # With capped replies the verdict context can be sized for the whole debate
+        # up front, so a judge with its own model is loaded once, during round 1,
+        # with the options every later judge request uses. A judge sharing a
+        # debater's model is not warmed: a different num_ctx would reload it.
+        judge_options = self._upfront_judge_options(options, rounds)
+        if judge_options is not None:
+            judge_prefill_options = {**judge_options, "num_predict": 1}
+        debaters = {(p.model, p.host) for p in (self.machiavelli, self.socrates)}
+        preload_judge = (
+            self.warm_up_judge
+            and judge_prefill_options is not None
+            and (self.judge.model, self.judge.host) not in debaters
+        )
+
+        async def load_judge_after(opening: asyncio.Task) -> None:
+            # Queue behind the opening, so a server that cannot hold both models
+            # does not load the judge first and then evict it for Machiavelli.
+            await asyncio.wait({opening})
+            await self._prefill(
+                clients, self.judge, [self.judge.system_message], judge_prefill_options, self.keep_alive
+            )
+
+        async def settle_prefill() -> None:
+            # Best effort: a failed prefill only costs the cache hit.
+            if prefill is not None:
+                await asyncio.gather(prefill, return_exceptions=True)
+
+        async def start_verdict() -> asyncio.Task:
+            await settle_prefill()
+            if judge_warm is not None:
+                await asyncio.gather(judge_warm, return_exceptions=True)
+            full_text = transcript_text(transcript_entries)
+            verdict_options = judge_options
+            needed = self._judge_options(len(full_text))
+            if verdict_options is None or needed["num_ctx"] > verdict_options["num_ctx"]:
+                # Uncapped replies (or an estimate that fell short): size for the real
+                # prompt, even if that reloads the judge, so it is never truncated.
+                verdict_options = needed
+            return self._start_reply(
+                clients, self.judge, self._judge_messages(full_text), verdict_options, self.keep_alive
+            )
 
         try:
-            for _i in range(rounds):
+            for i in range(rounds):
                 # Machiavelli turn
-                history_m.append({"role": "user", "content": current_input})
-                res_m = ollama.chat(
-                    model=self.machiavelli.model,
-                    messages=[{"role": "system", "content": self.machiavelli.system_prompt}] + history_m,
-                    options=self.llm_options,
-                )
+                if i == 0:
+                    opening = f"Start a debate on the topic: {topic}. State your position briefly."
+                    history_m.append({"role": "user", "content": opening})
+                    pending = self._start_reply(
+                        clients, self.machiavelli, [system_m, *history_m], opening_options, self.keep_alive
+                    )
+                    if preload_judge:
+                        judge_warm = asyncio.create_task(load_judge_after(pending))
+                text_m, res_m = await self._finish_reply(pending, self.machiavelli, on_token)
                 prompt_m, completion_m = token_counts(res_m)
                 total_prompt += prompt_m
                 total_completion += completion_m
-                think_m, speech_m = extract_think(res_m["message"]["content"])
+                think_m, speech_m = extract_think(text_m)
                 history_m.append({"role": "assistant", "content": speech_m})
-                transcript_plain.append(f"{self.machiavelli.name}: {speech_m}")
                 entry_m = {
                     "name": self.machiavelli.name,
                     "icon": self.machiavelli.icon,
@@ -269,22 +786,42 @@ class Arena:
                     "completion_tokens": completion_m,
                 }
                 transcript_entries.append(entry_m)
-                if on_speech is not None:
-                    on_speech(entry_m)
 
                 # Socrates turn
                 history_s.append({"role": "user", "content": speech_m})
-                res_s = ollama.chat(
-                    model=self.socrates.model,
-                    messages=[{"role": "system", "content": self.socrates.system_prompt}] + history_s,
-                    options=self.llm_options,
+                pending = self._start_reply(
+                    clients, self.socrates, [system_s, *history_s], options, self.keep_alive
                 )
+                # While Socrates speaks, prefill the next prompt's prefix
+                if i == rounds - 1:
+                    partial = transcript_text(transcript_entries)
+                    if judge_prefill_options is None:
+                        # Uncapped replies: the last speech has no bound, so the prefill is
+                        # sized to the partial transcript and only helps if the verdict,
+                        # sized once the transcript is complete, lands on the same num_ctx.
+                        judge_prefill_options = {**self._judge_options(len(partial)), "num_predict": 1}
+                    prefill = asyncio.create_task(
+                        self._prefill(
+                            clients, self.judge, self._judge_messages(partial), judge_prefill_options, self.keep_alive
+                        )
+                    )
+                else:
+                    # The next prompt drops the oldest message once the window is full.
+                    prefix = list(history_m)
+                    if history_m.maxlen is not None and len(prefix) == history_m.maxlen:
+                        del prefix[0]
+                    prefill = asyncio.create_task(
+                        self._prefill(
+                            clients, self.machiavelli, [system_m, *prefix], prefill_options, self.keep_alive
+                        )
+                    )
+                await self._deliver(on_speech, entry_m)
+                text_s, res_s = await self._finish_reply(pending, self.socrates, on_token)
                 prompt_s, completion_s = token_counts(res_s)
                 total_prompt += prompt_s
                 total_completion += completion_s
-                think_s, speech_s = extract_think(res_s["message"]["content"])
+                think_s, speech_s = extract_think(text_s)
                 history_s.append({"role": "assistant", "content": speech_s})
-                transcript_plain.append(f"{self.socrates.name}: {speech_s}")
                 entry_s = {
                     "name": self.socrates.name,
                     "icon": self.socrates.icon,
@@ -294,24 +831,26 @@ class Arena:
                     "completion_tokens": completion_s,
                 }
                 transcript_entries.append(entry_s)
-                if on_speech is not None:
-                    on_speech(entry_s)
 
-                current_input = speech_s
+                # Dispatch the next turn (or the verdict) before rendering this one
+                if i < rounds - 1:
+                    await settle_prefill()
+                    history_m.append({"role": "user", "content": speech_s})
+                    pending = self._start_reply(
+                        clients, self.machiavelli, [system_m, *history_m], options, self.keep_alive
+                    )
+                else:
+                    pending = await start_verdict()
+                await self._deliver(on_speech, entry_s)
 
             # Judge verdict
-            full_text = "\n".join(transcript_plain)
-            res_j = ollama.chat(
-                model=self.judge.model,
-                messages=[
-                    {"role": "system", "content": self.judge.system_prompt},
-                    {"role": "user", "content": full_text},
-                ],
-            )
+            if pending is None:
+                pending = await start_verdict()
+            text_j, res_j = await self._finish_reply(pending, self.judge, on_token)
             prompt_j, completion_j = token_counts(res_j)
             total_prompt += prompt_j
             total_completion += completion_j
-            verdict_text = res_j["message"]["content"].strip()
+            verdict_text = text_j.strip()
             if on_verdict is not None:
                 on_verdict(verdict_text, prompt_j, completion_j)
             return BattleResult(
@@ -326,7 +865,10 @@ class Arena:
                 interrupted=False,
             )
 
-        except KeyboardInterrupt:  # pragma: no cover - interactive behaviour
+        except (KeyboardInterrupt, asyncio.CancelledError):  # pragma: no cover - interactive behaviour
+            for task in (pending, prefill, judge_warm):
+                if task is not None:
+                    task.cancel()
             verdict_text = "(Debate interrupted by user.)"
             return BattleResult(
                 topic=topic,
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.live import Live
 from rich.panel import Panel
+from rich.progress import Progress, TaskID
+from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
 
@@ -15,15 +20,19 @@ from arena import (
     Arena,
     BattleResult,
     Participant,
-    check_ollama_running,
+    OllamaNotRunningError,
     ensure_models_available,
     load_config,
     save_debate_to_md,
+    warm_up_models,
 )
 
 
 console = Console()
 PANEL_WIDTH = console.width
+ERROR_PANEL_WIDTH = min(72, PANEL_WIDTH)
+VERDICT_TITLE = "⚖️  VERDICT"
+VERDICT_BORDER_STYLE = "gold1"
 
 DEFAULT_TOPIC = (
     "What is better for society: total state control or complete anarchy and absence of vertical power structure"
@@ -37,7 +46,7 @@ def _error_exit(message: str, *, title: str = "Error") -> None:
             message,
             title=f"[bold red]{title}[/]",
             border_style="red",
-            width=min(72, PANEL_WIDTH),
+            width=ERROR_PANEL_WIDTH,
         )
     )
     sys.exit(1)
@@ -56,34 +65,124 @@ def _print_settings_table(args: argparse.Namespace) -> None:
     console.print()
 
 
+def _token_line(prompt: int, completion: int) -> Text:
+    return Text(f"Tokens: prompt: {prompt}, completion: {completion}, total: {prompt + completion}", style="dim")
+
+
+@lru_cache(maxsize=None)
+def _speech_header(name: str, icon: str) -> Tuple[str, str]:
+    """Panel title and border style for a speaker, built once per speaker."""
+    title = f"{icon} {name.upper()}" if icon else name.upper()
+    return title, "magenta" if name == "Machiavelli" else "cyan"
+
+
 def _print_speech(entry: Dict[str, Any]) -> None:
     """Print one participant's speech in a Rich panel."""
-    name = entry["name"]
-    icon = entry["icon"]
+    title, border_style = _speech_header(entry["name"], entry["icon"])
     think = (entry.get("think") or "").strip()
     speech = entry["speech"]
-    border_style = "magenta" if name == "Machiavelli" else "cyan"
 
-    body = Text()
     if think:
-        body.append("🔍 Thoughts: ", style="dim")
-        body.append(think, style="dim italic")
-        body.append("\n\n")
-    body.append(speech)
+        body = Text.assemble(("🔍 Thoughts: ", "dim"), (think, "dim italic"), "\n\n", speech)
+    else:
+        body = Text(speech)
 
-    console.print(
-        Panel(
-            body,
-            title=f"{icon} {name.upper()}",
-            border_style=border_style,
-            width=PANEL_WIDTH,
-        )
-    )
+    panel = Panel(body, title=title, border_style=border_style, width=PANEL_WIDTH)
     p = entry.get("prompt_tokens")
     c = entry.get("completion_tokens")
     if p is not None and c is not None:
-        console.print(f"[dim]Tokens: prompt: {p}, completion: {c}, total: {p + c}[/]")
-    console.print()
+        # One print renders and writes the whole block at once.
+        console.print(Group(panel, _token_line(p, c), Text()))
+    else:
+        console.print(Group(panel, Text()))
+
+
+class _StreamedReply:
+    """A reply still being generated, rendered the way the final panel will look.
+
+    Chunks are only joined when Live refreshes (10x per second), and the
+    <think> section is shown dimmed without its tags, even while still open.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[str] = []
+
+    def append(self, piece: str) -> None:
+        self._parts.append(piece)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        raw = "".join(self._parts)
+        before, open_tag, rest = raw.partition("<think>")
+        if not open_tag:
+            yield Text(raw)
+            return
+        think, close_tag, after = rest.partition("</think>")
+        text = Text(before)
+        text.append("🔍 Thoughts: ", style="dim")
+        text.append(think.strip(), style="dim italic")
+        if close_tag:
+            text.append("\n\n" + after.lstrip())
+        yield text
+
+
+class _LiveSpeech:
+    """Render the reply currently being streamed below the finished panels.
+
+    One transient Live display (and refresh thread) serves the whole debate;
+    each turn only swaps its renderable. Between turns it shows a spinner.
+    headers maps speaker name to the (title, border_style) of its final panel.
+    """
+
+    def __init__(self, headers: Dict[str, Tuple[str, str]]) -> None:
+        self._headers = headers
+        self._idle = Spinner("dots", text=Text("Thinking...", style="dim"))
+        self._live = Live(self._idle, console=console, refresh_per_second=10, transient=True)
+        self._name: Optional[str] = None
+        self._reply = _StreamedReply()
+
+    def start(self) -> None:
+        self._live.start()
+
+    def feed(self, name: str, piece: str) -> None:
+        if name != self._name:
+            self._name = name
+            self._reply = _StreamedReply()
+            title, border_style = self._headers[name]
+            self._live.update(Panel(self._reply, title=title, border_style=border_style, width=PANEL_WIDTH))
+        self._reply.append(piece)
+
+    def end_turn(self) -> None:
+        """Drop the streamed panel so the final one can be printed in its place."""
+        self._name = None
+        self._live.update(self._idle, refresh=True)
+
+    def stop(self) -> None:
+        self._live.stop()
+
+
+class _PullProgress:
+    """Show one progress bar per model being pulled; created on the first update."""
+
+    def __init__(self) -> None:
+        self._progress: Optional[Progress] = None
+        self._tasks: Dict[str, TaskID] = {}
+
+    def update(self, model_name: str, status: str, completed: int, total: int) -> None:
+        if self._progress is None:
+            self._progress = Progress(console=console)
+            self._progress.start()
+        if model_name not in self._tasks:
+            self._tasks[model_name] = self._progress.add_task(model_name, total=None)
+        self._progress.update(
+            self._tasks[model_name],
+            description=f"{model_name}: {status}",
+            completed=completed,
+            total=total or None,
+        )
+
+    def stop(self) -> None:
+        if self._progress is not None:
+            self._progress.stop()
 
 
 def parse_args(config: Dict[str, Any]) -> argparse.Namespace:
@@ -126,7 +225,7 @@ def parse_args(config: Dict[str, Any]) -> argparse.Namespace:
     return parser.parse_args()
 
 
-def main() -> None:
+async def main() -> None:
     """Entry point for the CLI."""
     try:
         config = load_config()
@@ -139,19 +238,25 @@ def main() -> None:
 
     args = parse_args(config)
 
+    settings = config.get("settings") or {}
+    endpoints = config.get("ollama_endpoints") or {}
+    pull_progress = _PullProgress()
     try:
-        check_ollama_running()
-    except Exception as e:
-        _error_exit(f"Ollama server is not running: {e}\n\nPlease start Ollama app or run 'ollama serve'.")
-
-    try:
-        ensure_models_available(args.model_m, args.model_s, args.judge)
+        await ensure_models_available(
+            args.model_m,
+            args.model_s,
+            args.judge,
+            endpoints=endpoints,
+            on_progress=pull_progress.update,
+            max_parallel_pulls=int(settings.get("max_parallel_pulls", 2)),
+        )
+    except OllamaNotRunningError as e:
+        _error_exit(f"{e}\n\nPlease start Ollama app or run 'ollama serve'.")
     except Exception as e:
         _error_exit(f"Model error: {e}")
+    finally:
+        pull_progress.stop()
 
-    _print_settings_table(args)
-
-    settings = config.get("settings") or {}
     llm_options = {
         "num_predict": settings.get("num_predict", 350),
         "temperature": settings.get("temperature", 0.8),
@@ -167,6 +272,7 @@ def main() -> None:
             "You are Machiavelli. Speak English. You are a cynical pragmatist. Defend state interest and order at any cost.",
         ),
         icon="🦊",
+        host=endpoints.get("machiavelli"),
     )
     socrates = Participant(
         name="Socrates",
@@ -176,6 +282,7 @@ def main() -> None:
             "You are Socrates. Speak English. Use Socratic method: ask short, probing questions. Be humble but ironic.",
         ),
         icon="🏛",
+        host=endpoints.get("socrates"),
     )
     judge = Participant(
         name="Judge",
@@ -185,9 +292,43 @@ def main() -> None:
             "You are the Supreme Judge. Analyze the debate. Who won: Socrates or Machiavelli? Answer briefly and strictly in English.",
         ),
         icon="⚖️",
+        host=endpoints.get("judge"),
     )
 
-    arena = Arena(machiavelli=machiavelli, socrates=socrates, judge=judge, llm_options=llm_options)
+    arena = Arena(
+        machiavelli=machiavelli,
+        socrates=socrates,
+        judge=judge,
+        llm_options=llm_options,
+        history_window=int(settings.get("history_window", 2)),
+        keep_alive=settings.get("keep_alive", "30m"),
+        opening_num_predict=int(settings.get("opening_num_predict", 120)),
+        judge_num_predict=int(settings.get("judge_num_predict", 200)),
+        warm_up_judge=not settings.get("warm_up", True),
+    )
+
+    if settings.get("warm_up", True):
+        model_names = list(dict.fromkeys((args.model_m, args.model_s, args.judge)))
+        try:
+            with console.status("Loading models..."):
+                evicted = await warm_up_models(
+                    args.model_m,
+                    args.model_s,
+                    args.judge,
+                    keep_alive=settings.get("keep_alive", "30m"),
+                    endpoints=endpoints,
+                    options=arena.load_options(args.topic, int(args.rounds)),
+                )
+        except Exception as e:
+            _error_exit(f"Model error: {e}")
+        if evicted:
+            console.print(
+                f"[yellow]Not all models stay loaded at once ({', '.join(evicted)} evicted); "
+                f"weights will be reloaded between turns. Start Ollama with "
+                f"OLLAMA_MAX_LOADED_MODELS={len(model_names)} if memory allows.[/]"
+            )
+
+    _print_settings_table(args)
 
     console.print()
     console.print(
@@ -200,33 +341,49 @@ def main() -> None:
     )
     console.print()
 
+    live_speech = _LiveSpeech(
+        {
+            machiavelli.name: _speech_header(machiavelli.name, machiavelli.icon),
+            socrates.name: _speech_header(socrates.name, socrates.icon),
+            judge.name: (VERDICT_TITLE, VERDICT_BORDER_STYLE),
+        }
+    )
+
     def on_speech(entry: Dict[str, Any]) -> None:
+        live_speech.end_turn()
         _print_speech(entry)
 
     def on_verdict(text: str, p: int, c: int) -> None:
+        live_speech.end_turn()
         console.print(
-            Panel(
-                Text(text, style="bold"),
-                title="⚖️  VERDICT",
-                border_style="gold1",
-                width=PANEL_WIDTH,
+            Group(
+                Panel(
+                    Text(text, style="bold"),
+                    title=VERDICT_TITLE,
+                    border_style=VERDICT_BORDER_STYLE,
+                    width=PANEL_WIDTH,
+                ),
+                _token_line(p, c),
+                Text(),
             )
         )
-        console.print(f"[dim]Tokens: prompt: {p}, completion: {c}, total: {p + c}[/]")
-        console.print()
 
+    live_speech.start()
     try:
-        result: BattleResult = arena.run_battle(
+        result: BattleResult = await arena.run_battle(
             args.topic,
             rounds=int(args.rounds),
             on_speech=on_speech,
             on_verdict=on_verdict,
+            on_token=live_speech.feed,
         )
     except KeyboardInterrupt:  # pragma: no cover - interactive
         console.print("[yellow]Debate interrupted by user.[/]")
         sys.exit(130)
     except Exception as e:  # pragma: no cover - defensive
         _error_exit(f"Unexpected error while running debate: {e}")
+    finally:
+        live_speech.stop()
 
     debates_dir = settings.get("debates_dir", "debates")
     try:
@@ -243,6 +400,8 @@ def main() -> None:
                 "total": result.token_total,
             },
             debates_dir=debates_dir,
+            include_thoughts=bool(settings.get("save_thoughts", False)),
+            compress=bool(settings.get("compress", False)),
         )
         console.print(f"[dim]Debate saved to {filepath}[/]")
     except OSError as e:
@@ -250,5 +409,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
 
@@ -0,0 +1,41 @@
+"""Shared pytest fixtures."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import arena
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_cache(tmp_path, monkeypatch):
+    """Keep the known-models cache out of the user's home directory."""
+    monkeypatch.setattr(arena, "MODEL_CACHE_PATH", tmp_path / "models.json")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config_cache():
+    """load_config memoizes parsed files; start every test with an empty cache."""
+    arena._parse_config.cache_clear()
+    yield
+    arena._parse_config.cache_clear()
+
+
+class _OfflineClient:
+    """Default AsyncClient for tests: any request fails instead of reaching a real server."""
+
+    def __init__(self, host=None, **kwargs):
+        self.host = host
+
+    def __getattr__(self, name):
+        async def call(*args, **kwargs):
+            raise AssertionError(f"test called AsyncClient.{name}() without patching arena.AsyncClient")
+
+        return call
+
+
+@pytest.fixture(autouse=True)
+def _no_ollama(monkeypatch):
+    """Never contact an Ollama server; tests patch arena.AsyncClient with their own fakes."""
+    monkeypatch.setattr(arena, "AsyncClient", _OfflineClient)
@@ -1,8 +1,10 @@
 """Pytest tests for config loading, log filename formatting, and token handling."""
+import asyncio
+import os
 import sys
 from datetime import date
 from pathlib import Path
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 
 import pytest
 
@@ -143,3 +145,336 @@ def test_processing_mocked_ollama_chat_response():
     think, speech = arena.extract_think(fake_response["message"]["content"])
     assert "Considering" in think
     assert "Order is preferable" in speech
+
+
+# --- Model availability (mocked AsyncClient) ---
+
+def test_ensure_models_available_pulls_only_missing_models():
+    """Models answering 404 on show() are pulled; duplicates are probed once."""
+    client = MagicMock()
+
+    async def fake_show(name):
+        if name == "missing:latest":
+            raise arena._ollama().ResponseError("not found", 404)
+        return {}
+
+    async def fake_pull(name, stream=False):
+        async def gen():
+            yield {"status": "pulling", "completed": 5, "total": 10}
+            yield {"status": "success"}
+
+        return gen()
+
+    client.show = AsyncMock(side_effect=fake_show)
+    client.pull = AsyncMock(side_effect=fake_pull)
+    updates = []
+    with patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(
+            arena.ensure_models_available(
+                "a:latest", "a:latest", "missing:latest", on_progress=lambda *u: updates.append(u)
+            )
+        )
+    assert client.show.await_count == 2
+    client.pull.assert_awaited_once_with("missing:latest", stream=True)
+    assert updates == [("missing:latest", "pulling", 5, 10), ("missing:latest", "success", 0, 0)]
+
+
+# --- Streaming debate loop (mocked AsyncClient) ---
+
+class _FakeStreamClient:
+    """Stand-in for ollama.AsyncClient whose chat() streams a canned reply in two chunks."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    async def chat(self, model, messages, options=None, stream=False, keep_alive=None, **kwargs):
+        self.calls.append(
+            {"model": model, "messages": list(messages), "options": options, "stream": stream, "keep_alive": keep_alive}
+        )
+
+        async def gen():
+            yield {"message": {"content": "<think>hmm</think>Hello "}}
+            yield {"message": {"content": "there"}, "prompt_eval_count": 10, "eval_count": 5}
+
+        return gen()
+
+
+def _make_arena():
+    return arena.Arena(
+        machiavelli=arena.Participant("Machiavelli", "m", "You are M.", "🦊"),
+        socrates=arena.Participant("Socrates", "s", "You are S.", "🏛"),
+        judge=arena.Participant("Judge", "j", "You are J.", "⚖️"),
+    )
+
+
+def test_run_battle_streams_tokens_and_counts_from_final_chunk():
+    """Chunks are forwarded to on_token; token counts come from the final chunk."""
+    tokens = []
+    with patch.object(arena, "AsyncClient", _FakeStreamClient):
+        result = asyncio.run(
+            _make_arena().run_battle("Topic", rounds=1, on_token=lambda name, piece: tokens.append(name))
+        )
+    assert tokens == ["Machiavelli", "Machiavelli", "Socrates", "Socrates", "Judge", "Judge"]
+    assert [e["speech"] for e in result.transcript_entries] == ["Hello there", "Hello there"]
+    assert result.transcript_entries[0]["think"] == "hmm"
+    assert result.verdict == "<think>hmm</think>Hello there"
+    assert result.token_prompt == 30
+    assert result.token_completion == 15
+
+
+def test_warm_up_models_reports_evicted_models():
+    """Models not listed by ps() after warm-up are reported; bare names match ':latest'."""
+    client = MagicMock()
+    client.generate = AsyncMock()
+    client.ps = AsyncMock(return_value={"models": [{"model": "a:latest"}]})
+    with patch.object(arena, "AsyncClient", return_value=client):
+        evicted = asyncio.run(arena.warm_up_models("a", "b:3b", "a"))
+    assert evicted == ["b:3b"]
+    assert client.generate.await_count == 2
+
+
+def test_warm_up_models_loads_each_model_with_its_debate_options():
+    """Warm-up sends the num_ctx the debate will use, so the first turn does not reload the model."""
+    client = MagicMock()
+    client.generate = AsyncMock()
+    client.ps = AsyncMock(return_value={"models": []})
+    debate = _make_arena()
+    options = debate.load_options("Topic", 2)
+    with patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(arena.warm_up_models("m", "s", "j", options=options))
+    sent = {c.kwargs["model"]: c.kwargs["options"] for c in client.generate.await_args_list}
+    assert sent["m"] == {**options["machiavelli"], "num_predict": 1}
+    assert sent["j"]["num_ctx"] == options["judge"]["num_ctx"]
+
+    fake = _FakeStreamClient()
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=2))
+    assert {c["options"]["num_ctx"] for c in fake.calls if c["model"] == "m"} == {sent["m"]["num_ctx"]}
+    assert {c["options"]["num_ctx"] for c in fake.calls if c["model"] == "j"} == {sent["j"]["num_ctx"]}
+
+
+def test_run_battle_trims_debater_history_to_window():
+    """With history_window=1 each debater prompt holds system + last pair + new user message."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.history_window = 1
+    debate.keep_alive = "30m"
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=3))
+    machiavelli_calls = [c for c in fake.calls if c["model"] == "m" and c["stream"]]
+    assert [len(c["messages"]) for c in machiavelli_calls] == [2, 4, 4]
+    assert all(c["keep_alive"] == "30m" for c in machiavelli_calls)
+
+
+def test_run_battle_prefills_judge_with_partial_transcript():
+    """The judge is warmed after the opening is sent, then prefilled with the transcript minus the last speech."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.keep_alive = "30m"
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=1))
+    judge_calls = [c for c in fake.calls if c["model"] == "j"]
+    assert len(judge_calls) == 3
+    (warm,) = [c for c in judge_calls if len(c["messages"]) == 1]
+    prefill, verdict = [c for c in judge_calls if c is not warm]
+    assert fake.calls[0]["model"] == "m" and fake.calls.index(warm) > 0
+    assert warm["messages"] == [{"role": "system", "content": "You are J."}]
+    assert warm["options"] == prefill["options"]
+    assert prefill["stream"] is False
+    assert prefill["options"]["num_predict"] == 1
+    assert prefill["options"]["num_ctx"] == verdict["options"]["num_ctx"]
+    assert verdict["options"]["num_predict"] == 200
+    assert all(c["keep_alive"] == "30m" for c in judge_calls)
+    assert prefill["messages"][1]["content"] == "Machiavelli: Hello there"
+    assert verdict["messages"][1]["content"].startswith(prefill["messages"][1]["content"])
+
+
+def test_run_battle_skips_judge_warm_up_after_startup_warm_up():
+    """warm_up_judge=False (warm_up_models already loaded it) sends no extra judge request."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.warm_up_judge = False
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=1))
+    assert [len(c["messages"]) for c in fake.calls if c["model"] == "j"] == [2, 2]
+
+
+def test_run_battle_skips_judge_warm_up_when_it_shares_a_debater_model():
+    """Warming a shared model with the judge's num_ctx would reload it mid-debate."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.judge.model = "m"
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=1))
+    assert fake.calls[0]["messages"][-1]["role"] == "user"
+    assert sum(1 for c in fake.calls if c["messages"][0]["content"] == "You are J.") == 2
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path):
+    """Repeated loads of an unchanged file hit the cache; a new mtime forces a re-parse."""
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text("settings:\n  default_rounds: 1\n", encoding="utf-8")
+    first = arena.load_config(cfg)
+    assert arena.load_config(cfg) is first
+    cfg.write_text("settings:\n  default_rounds: 4\n", encoding="utf-8")
+    stat = cfg.stat()
+    os.utime(cfg, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert arena.load_config(cfg)["settings"]["default_rounds"] == 4
+
+
+def test_ensure_models_available_reports_unreachable_server():
+    """A connection failure during the probes surfaces as OllamaNotRunningError."""
+    client = MagicMock()
+    client.show = AsyncMock(side_effect=ConnectionError("connection refused"))
+    with patch.object(arena, "AsyncClient", return_value=client):
+        with pytest.raises(arena.OllamaNotRunningError):
+            asyncio.run(arena.ensure_models_available("a", "b", "c"))
+
+
+def test_ensure_models_available_reports_unreachable_server_with_warm_cache():
+    """Cached models skip the probes, but a stopped server is still reported."""
+    client = MagicMock()
+    client.show = AsyncMock()
+    with patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(arena.ensure_models_available("a", "b", "c"))
+    client.list = AsyncMock(side_effect=ConnectionError("connection refused"))
+    with patch.object(arena, "AsyncClient", return_value=client):
+        with pytest.raises(arena.OllamaNotRunningError):
+            asyncio.run(arena.ensure_models_available("a", "b", "c"))
+    assert client.show.await_count == 3
+
+
+async def _empty_stream():
+    return
+    yield
+
+
+def test_cached_model_removed_from_server_is_pulled_again():
+    """A model deleted after it was cached is noticed, both at startup and on a 404 mid-run."""
+    client = MagicMock()
+    client.show = AsyncMock()
+    client.pull = AsyncMock(side_effect=lambda name, stream=False: _empty_stream())
+    client.list = AsyncMock(return_value={"models": [{"model": "m:latest"}, {"model": "s:latest"}]})
+    with patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(arena.ensure_models_available("m", "s", "j"))
+        asyncio.run(arena.ensure_models_available("m", "s", "j"))
+    client.pull.assert_awaited_once_with("j", stream=True)
+
+    client.generate = AsyncMock(side_effect=arena._ollama().ResponseError("model 'j' not found", 404))
+    with patch.object(arena, "AsyncClient", return_value=client):
+        with pytest.raises(arena._ollama().ResponseError):
+            asyncio.run(arena.warm_up_models("m", "s", "j"))
+    assert "j" not in arena._load_model_cache()[arena._endpoint_key(None)]
+
+
+def test_ensure_models_available_uses_one_client_per_endpoint():
+    """Each role is probed on its configured server; roles without one share the default."""
+    hosts = []
+
+    def make_client(host=None):
+        hosts.append(host)
+        client = MagicMock()
+        client.show = AsyncMock()
+        return client
+
+    endpoints = {"socrates": "http://127.0.0.1:11435"}
+    with patch.object(arena, "AsyncClient", side_effect=make_client):
+        asyncio.run(arena.ensure_models_available("m", "s", "j", endpoints=endpoints))
+    assert hosts == [None, "http://127.0.0.1:11435"]
+
+
+def test_ensure_models_available_skips_probes_when_cache_is_fresh():
+    """A second call within the TTL replaces the per-model probes with one list() call."""
+    client = MagicMock()
+    client.show = AsyncMock()
+    client.pull = AsyncMock()
+    client.list = AsyncMock(return_value={"models": [{"model": n} for n in ("m:latest", "s:latest", "j:latest")]})
+    with patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(arena.ensure_models_available("m", "s", "j"))
+        asyncio.run(arena.ensure_models_available("m", "s", "j"))
+    assert client.show.await_count == 3
+    assert client.list.await_count == 1
+    client.pull.assert_not_awaited()
+    with patch.object(arena, "MODEL_CACHE_TTL", 0), patch.object(arena, "AsyncClient", return_value=client):
+        asyncio.run(arena.ensure_models_available("m", "s", "j"))
+    assert client.show.await_count == 6
+
+
+def test_run_battle_renders_each_speech_before_next_speaker_tokens():
+    """Dispatching the next request early does not reorder UI callbacks."""
+    events = []
+
+    def on_token(name, piece):
+        if not events or events[-1] != ("token", name):
+            events.append(("token", name))
+
+    with patch.object(arena, "AsyncClient", _FakeStreamClient):
+        asyncio.run(
+            _make_arena().run_battle(
+                "Topic",
+                rounds=2,
+                on_speech=lambda entry: events.append(("speech", entry["name"])),
+                on_token=on_token,
+                on_verdict=lambda text, p, c: events.append(("verdict", "Judge")),
+            )
+        )
+    assert events == [
+        ("token", "Machiavelli"), ("speech", "Machiavelli"),
+        ("token", "Socrates"), ("speech", "Socrates"),
+        ("token", "Machiavelli"), ("speech", "Machiavelli"),
+        ("token", "Socrates"), ("speech", "Socrates"),
+        ("token", "Judge"), ("verdict", "Judge"),
+    ]
+
+
+def test_run_battle_caps_opening_and_sizes_context_to_window():
+    """The opening gets the smaller budget; num_ctx shrinks once, to the same value for every turn."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.llm_options = {"num_predict": 300, "temperature": 0.8, "num_ctx": 4096}
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=2))
+    debater_calls = [c for c in fake.calls if c["model"] in ("m", "s") and c["stream"]]
+    assert debater_calls[0]["options"]["num_predict"] == 120
+    assert all(c["options"]["num_predict"] == 300 for c in debater_calls[1:])
+    assert {c["options"]["num_ctx"] for c in debater_calls} == {2048}
+
+
+def test_run_battle_prefills_next_machiavelli_prompt_prefix():
+    """Between rounds, Machiavelli's next prompt minus the new user turn is prefilled first."""
+    fake = _FakeStreamClient()
+    debate = _make_arena()
+    debate.history_window = 1
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=3))
+    machiavelli_calls = [c for c in fake.calls if c["model"] == "m"]
+    assert [c["stream"] for c in machiavelli_calls] == [True, False, True, False, True]
+    for prefill, reply in zip(machiavelli_calls[1::2], machiavelli_calls[2::2]):
+        assert prefill["options"]["num_predict"] == 1
+        assert prefill["options"]["num_ctx"] == reply["options"]["num_ctx"]
+        assert prefill["messages"] == reply["messages"][:-1]
+
+
+def test_run_battle_sizes_uncapped_verdict_to_the_full_transcript():
+    """With num_predict=-1 the last speech is unbounded, so the verdict is sized after it."""
+
+    class LongSocrates(_FakeStreamClient):
+        async def chat(self, model, messages, options=None, stream=False, keep_alive=None, **kwargs):
+            if model != "s":
+                return await super().chat(model, messages, options, stream, keep_alive, **kwargs)
+            self.calls.append({"model": model, "messages": list(messages), "options": options, "stream": stream})
+
+            async def gen():
+                yield {"message": {"content": "why " * 2000}, "prompt_eval_count": 1, "eval_count": 1}
+
+            return gen()
+
+    fake = LongSocrates()
+    debate = _make_arena()
+    debate.llm_options = {"num_predict": -1, "num_ctx": 4096}
+    with patch.object(arena, "AsyncClient", return_value=fake):
+        asyncio.run(debate.run_battle("Topic", rounds=1))
+    prefill, verdict = [c for c in fake.calls if c["model"] == "j"]
+    assert prefill["options"]["num_ctx"] == 1024
+    prompt_chars = sum(len(m["content"]) for m in verdict["messages"])
+    assert verdict["options"]["num_ctx"] * 3 >= prompt_chars
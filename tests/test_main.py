@@ -1,4 +1,6 @@
 """Simple tests for log filename creation and argument parsing."""
+import gzip
+import subprocess
 import sys
 from datetime import date
 from unittest.mock import patch
@@ -76,3 +78,58 @@ def test_parse_args_cli_overrides_config():
     assert args.model_m == "cli-model"
     assert args.model_s == "socrates-config"
     assert args.rounds == 3
+
+
+def test_extract_think_splits_thoughts_from_speech():
+    """Think block is removed from the speech and capped at 200 chars."""
+    think, speech = arena.extract_think("Intro\n\n<think>" + "x" * 250 + "</think>\nOutro")
+    assert think == "x" * 200 + "..."
+    assert speech == "Intro\nOutro"
+    assert arena.extract_think("No thoughts here") == ("", "No thoughts here")
+    assert arena.extract_think("Unclosed <think>tag") == ("", "Unclosed <think>tag")
+    assert arena.extract_think("<think>\n a\n\n\nb \n</think>x") == ("a\nb", "x")
+    assert arena.extract_think("x <think>t1</think> mid <think>t2</think> end") == ("t1", "x  mid  end")
+    assert arena.extract_think("<think>t1</think>a <think>open") == ("t1", "a <think>open")
+
+
+def test_build_markdown_quotes_every_speech_line():
+    """Multi-line speeches are rendered as a blockquote, one '> ' prefix per line."""
+    entries = [{"name": "Socrates", "icon": "🏛", "think": "", "speech": "First line\nSecond line"}]
+    md = arena.build_markdown("T", "m", "s", "j", entries, "Socrates wins")
+    assert "> **🏛 Socrates:**\n> First line\n> Second line\n" in md
+    assert md.startswith("# Debate: T\n")
+
+
+def test_save_debate_to_md_writes_same_content_as_build_markdown(tmp_path):
+    """The streamed file matches build_markdown byte for byte."""
+    entries = [{"name": "Machiavelli", "icon": "🦊", "think": "plan", "speech": "Order.\nAlways."}]
+    stats = {"prompt": 1, "completion": 2, "total": 3}
+    path = arena.save_debate_to_md(
+        "Topic", "m", "s", "j", entries, "Verdict", stats, debates_dir=str(tmp_path), include_thoughts=True
+    )
+    expected = arena.build_markdown("Topic", "m", "s", "j", entries, "Verdict", stats, include_thoughts=True)
+    assert Path(path).read_text(encoding="utf-8") == expected
+    assert Path(path).name == f"{date.today().isoformat()}_topic.md"
+
+
+def test_save_debate_to_md_compressed_omits_thoughts_by_default(tmp_path):
+    """compress=True writes a .md.gz file; thoughts are left out unless requested."""
+    entries = [{"name": "Socrates", "icon": "🏛", "think": "secret plan", "speech": "Why?"}]
+    path = arena.save_debate_to_md("Topic", "m", "s", "j", entries, "V", debates_dir=str(tmp_path), compress=True)
+    assert path.endswith("_topic.md.gz")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        content = f.read()
+    assert content == arena.build_markdown("Topic", "m", "s", "j", entries, "V")
+    assert "secret plan" not in content
+
+
+def test_clean_text_collapses_blank_lines_and_strips():
+    """Runs of newlines collapse to one; text without blank lines is only stripped."""
+    assert arena.clean_text("  a\n\n\nb\nc \n") == "a\nb\nc"
+    assert arena.clean_text(" plain\nreply\n") == "plain\nreply"
+
+
+def test_importing_arena_does_not_import_ollama():
+    """The ollama SDK is only imported once a request is made."""
+    code = "import sys, arena, cli; assert 'ollama' not in sys.modules, 'ollama imported'"
+    subprocess.run([sys.executable, "-c", code], cwd=Path(arena.__file__).parent, check=True)